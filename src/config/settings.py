@@ -4,10 +4,12 @@ This module manages all environment variables and application settings.
 """
 
 import os
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
-from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -16,7 +18,7 @@ class Settings(BaseSettings):
     # Project settings
     PROJECT_NAME: str = "Second Brain AI Assistant"
     VERSION: str = "1.0.0"
-    DEBUG: bool = Field(default=False, env="DEBUG")
+    DEBUG: bool = False
     
     # Paths
     PROJECT_ROOT: Path = Path(__file__).parent.parent.parent
@@ -26,92 +28,190 @@ class Settings(BaseSettings):
     
     # API settings
     API_V1_STR: str = "/api/v1"
-    HOST: str = Field(default="0.0.0.0", env="HOST")
-    PORT: int = Field(default=8000, env="PORT")
+    HOST: str = "0.0.0.0"
+    PORT: int = 8000
     
     # Database settings (MongoDB)
-    MONGODB_URL: str = Field(default="mongodb+srv://<username>:<password>@<cluster>.mongodb.net/?retryWrites=true&w=majority", env="MONGODB_URL")
-    DATABASE_NAME: str = Field(default="second-brain", env="DATABASE_NAME")
-    COLLECTION_NAME: str = Field(default="knowledge_base", env="COLLECTION_NAME")
+    MONGODB_URL: str = "mongodb+srv://<username>:<password>@<cluster>.mongodb.net/?retryWrites=true&w=majority"
+    DATABASE_NAME: str = "second-brain"
+    COLLECTION_NAME: str = "knowledge_base"
     
     # MongoDB Atlas Vector Search settings
-    VECTOR_INDEX_NAME: str = Field(default="vector_index", env="VECTOR_INDEX_NAME")
-    TEXT_INDEX_NAME: str = Field(default="text_index", env="TEXT_INDEX_NAME")
-    VECTOR_DIMENSIONS: int = Field(default=384, env="VECTOR_DIMENSIONS")  # for all-MiniLM-L6-v2
+    VECTOR_INDEX_NAME: str = "vector_index"
+    TEXT_INDEX_NAME: str = "text_index"
+    VECTOR_DIMENSIONS: int = 384  # for all-MiniLM-L6-v2
     
     # Vector Database settings
-    VECTOR_DB_PATH: str = Field(default="./data/chroma_db", env="VECTOR_DB_PATH")
-    EMBEDDING_MODEL: str = Field(default="sentence-transformers/all-MiniLM-L6-v2", env="EMBEDDING_MODEL")
-    CHUNK_SIZE: int = Field(default=1000, env="CHUNK_SIZE")
-    CHUNK_OVERLAP: int = Field(default=200, env="CHUNK_OVERLAP")
+    VECTOR_DB_PATH: str = "./data/chroma_db"
+    EMBEDDING_MODEL: str = "sentence-transformers/all-MiniLM-L6-v2"
+    CHUNK_SIZE: int = 1000
+    CHUNK_OVERLAP: int = 200
     
     # LLM settings
-    OPENAI_API_KEY: Optional[str] = Field(default=None, env="OPENAI_API_KEY")
-    HUGGINGFACE_API_TOKEN: Optional[str] = Field(default=None, env="HUGGINGFACE_API_TOKEN")
-    LLM_MODEL: str = Field(default="gpt-4o", env="LLM_MODEL")
-    MAX_TOKENS: int = Field(default=4096, env="MAX_TOKENS")
-    TEMPERATURE: float = Field(default=0.1, env="TEMPERATURE")
+    OPENAI_API_KEY: Optional[str] = None
+    HUGGINGFACE_API_TOKEN: Optional[str] = None
+    LLM_MODEL: str = "gpt-4o"
+    MAX_TOKENS: int = 4096
+    TEMPERATURE: float = 0.1
     
     # Notion API settings (for data collection) - Following DecodingML naming
-    NOTION_SECRET_KEY: Optional[str] = Field(default=None, env="NOTION_SECRET_KEY")
-    NOTION_API_KEY: Optional[str] = Field(default=None, env="NOTION_API_KEY")  # Fallback
-    NOTION_DATABASE_ID: Optional[str] = Field(default=None, env="NOTION_DATABASE_ID")
+    NOTION_SECRET_KEY: Optional[str] = None
+    NOTION_API_KEY: Optional[str] = None  # Fallback
+    NOTION_DATABASE_ID: Optional[str] = None
     
     # Slack Integration settings
-    SLACK_BOT_TOKEN: Optional[str] = Field(default=None, env="SLACK_BOT_TOKEN")
-    SLACK_SIGNING_SECRET: Optional[str] = Field(default=None, env="SLACK_SIGNING_SECRET")
-    SLACK_APP_TOKEN: Optional[str] = Field(default=None, env="SLACK_APP_TOKEN")
+    SLACK_BOT_TOKEN: Optional[str] = None
+    SLACK_SIGNING_SECRET: Optional[str] = None
+    SLACK_APP_TOKEN: Optional[str] = None
     
     # Crawling settings
-    MAX_CRAWL_PAGES: int = Field(default=100, env="MAX_CRAWL_PAGES")
-    CRAWL_DELAY: float = Field(default=1.0, env="CRAWL_DELAY")
-    USER_AGENT: str = Field(
-        default="SecondBrainBot/1.0 (+https://github.com/your-username/second-brain)",
-        env="USER_AGENT"
-    )
+    MAX_CRAWL_PAGES: int = 100
+    CRAWL_DELAY: float = 1.0
+    USER_AGENT: str = "SecondBrainBot/1.0 (+https://github.com/your-username/second-brain)"
     
     # MLOps settings
-    COMET_API_KEY: Optional[str] = Field(default=None, env="COMET_API_KEY")
-    COMET_PROJECT_NAME: str = Field(default="second-brain-ai", env="COMET_PROJECT_NAME")
-    ZENML_STORE_URL: Optional[str] = Field(default=None, env="ZENML_STORE_URL")
+    COMET_API_KEY: Optional[str] = None
+    COMET_PROJECT_NAME: str = "second-brain-ai"
+    ZENML_STORE_URL: Optional[str] = None
     
     # Advanced RAG Feature Flags
-    ENABLE_ADVANCED_RAG: bool = Field(default=False, env="ENABLE_ADVANCED_RAG")
-    RAG_STRATEGY: str = Field(default="basic", env="RAG_STRATEGY")
-    RAG_CONFIG_PATH: str = Field(default="config/rag_config.yaml", env="RAG_CONFIG_PATH")
+    ENABLE_ADVANCED_RAG: bool = False
+    RAG_STRATEGY: str = "basic"
+    RAG_CONFIG_PATH: str = "config/rag_config.yaml"
     
     # Advanced RAG Features
-    ENABLE_CONTEXTUAL_CHUNKING: bool = Field(default=False, env="ENABLE_CONTEXTUAL_CHUNKING")
-    ENABLE_PARENT_RETRIEVAL: bool = Field(default=False, env="ENABLE_PARENT_RETRIEVAL")
-    ENABLE_HYBRID_SEARCH: bool = Field(default=False, env="ENABLE_HYBRID_SEARCH")
-    ENABLE_QUALITY_FILTERING: bool = Field(default=True, env="ENABLE_QUALITY_FILTERING")
+    ENABLE_CONTEXTUAL_CHUNKING: bool = False
+    ENABLE_PARENT_RETRIEVAL: bool = False
+    ENABLE_HYBRID_SEARCH: bool = False
+    ENABLE_QUALITY_FILTERING: bool = True
     
     # Parent-Child Chunking Settings
-    PARENT_CHUNK_SIZE: int = Field(default=2000, env="PARENT_CHUNK_SIZE")
-    CHILD_CHUNK_SIZE: int = Field(default=400, env="CHILD_CHUNK_SIZE")
-    PARENT_CHUNK_OVERLAP: int = Field(default=400, env="PARENT_CHUNK_OVERLAP")
-    CHILD_CHUNK_OVERLAP: int = Field(default=100, env="CHILD_CHUNK_OVERLAP")
+    PARENT_CHUNK_SIZE: int = 2000
+    CHILD_CHUNK_SIZE: int = 400
+    PARENT_CHUNK_OVERLAP: int = 400
+    CHILD_CHUNK_OVERLAP: int = 100
     
     # Logging settings
-    LOG_LEVEL: str = Field(default="INFO", env="LOG_LEVEL")
+    LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="",
+        case_sensitive=True,
+        extra="ignore",
+    )
+
+
+# Dataclass slots need Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class ResolvedSettings:
+    """
+    Immutable snapshot of Settings: validated once by pydantic, then read as
+    plain (slotted where supported) dataclass attributes. Fields mirror
+    Settings one-to-one.
+    """
+    
+    # Project settings
+    PROJECT_NAME: str
+    VERSION: str
+    DEBUG: bool
+    
+    # Paths
+    PROJECT_ROOT: Path
+    DATA_DIR: Path
+    LOGS_DIR: Path
+    MODELS_DIR: Path
+    
+    # API settings
+    API_V1_STR: str
+    HOST: str
+    PORT: int
+    
+    # Database settings (MongoDB)
+    MONGODB_URL: str
+    DATABASE_NAME: str
+    COLLECTION_NAME: str
+    
+    # MongoDB Atlas Vector Search settings
+    VECTOR_INDEX_NAME: str
+    TEXT_INDEX_NAME: str
+    VECTOR_DIMENSIONS: int
+    
+    # Vector Database settings
+    VECTOR_DB_PATH: str
+    EMBEDDING_MODEL: str
+    CHUNK_SIZE: int
+    CHUNK_OVERLAP: int
+    
+    # LLM settings
+    OPENAI_API_KEY: Optional[str]
+    HUGGINGFACE_API_TOKEN: Optional[str]
+    LLM_MODEL: str
+    MAX_TOKENS: int
+    TEMPERATURE: float
+    
+    # Notion API settings (for data collection) - Following DecodingML naming
+    NOTION_SECRET_KEY: Optional[str]
+    NOTION_API_KEY: Optional[str]
+    NOTION_DATABASE_ID: Optional[str]
+    
+    # Slack Integration settings
+    SLACK_BOT_TOKEN: Optional[str]
+    SLACK_SIGNING_SECRET: Optional[str]
+    SLACK_APP_TOKEN: Optional[str]
+    
+    # Crawling settings
+    MAX_CRAWL_PAGES: int
+    CRAWL_DELAY: float
+    USER_AGENT: str
+    
+    # MLOps settings
+    COMET_API_KEY: Optional[str]
+    COMET_PROJECT_NAME: str
+    ZENML_STORE_URL: Optional[str]
+    
+    # Advanced RAG Feature Flags
+    ENABLE_ADVANCED_RAG: bool
+    RAG_STRATEGY: str
+    RAG_CONFIG_PATH: str
+    
+    # Advanced RAG Features
+    ENABLE_CONTEXTUAL_CHUNKING: bool
+    ENABLE_PARENT_RETRIEVAL: bool
+    ENABLE_HYBRID_SEARCH: bool
+    ENABLE_QUALITY_FILTERING: bool
+    
+    # Parent-Child Chunking Settings
+    PARENT_CHUNK_SIZE: int
+    CHILD_CHUNK_SIZE: int
+    PARENT_CHUNK_OVERLAP: int
+    CHILD_CHUNK_OVERLAP: int
+    
+    # Logging settings
+    LOG_LEVEL: str
+    LOG_FORMAT: str
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> ResolvedSettings:
+    """Get application settings (validated and resolved once, on first use)."""
+    return ResolvedSettings(**Settings().model_dump())
 
 
-def get_settings() -> Settings:
-    """Get application settings."""
-    return settings
+def __getattr__(name: str):
+    """Lazily resolve the legacy module-level ``settings`` instance."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def ensure_directories():
     """Ensure all required directories exist."""
+    settings = get_settings()
     directories = [
         settings.DATA_DIR,
         settings.DATA_DIR / "raw",
@@ -127,6 +227,7 @@ def ensure_directories():
 
 if __name__ == "__main__":
     # Test settings loading
+    settings = get_settings()
     print(f"Project: {settings.PROJECT_NAME}")
     print(f"Version: {settings.VERSION}")
     print(f"Debug: {settings.DEBUG}")
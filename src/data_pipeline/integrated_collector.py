@@ -4,11 +4,14 @@ Each class handles a specific responsibility in the data collection process.
 """
 
 import asyncio
+from collections import Counter, defaultdict
 from typing import List, Dict, Optional, Tuple, Set
 from datetime import datetime
+from urllib.parse import urlparse
 
+from src.config.settings import get_settings
 from src.data_pipeline.notion_collector import collect_notion_documents
-from src.data_pipeline.web_crawler import BrowserConfig, CrawlerRunConfig, MemoryAdaptiveDispatcher, AsyncWebCrawler
+from src.data_pipeline.web_crawler import BrowserConfig, AsyncWebCrawler
 from src.models.schemas import Document, ProcessingStatus
 from src.utils.logger import LoggerMixin
 
@@ -58,34 +61,43 @@ class WebDataCollector(LoggerMixin):
         urls: Set[str],
         max_pages: int = 1000000
     ) -> List[Document]:
-        """Crawl embedded links from documents"""
-        if not urls:
+        """
+        Crawl embedded links from documents.
+        
+        At most MAX_CRAWL_PAGES // 10 pages are fetched at once and each host
+        gets at most half of those slots. A host's slot is held for CRAWL_DELAY
+        after a fetch only while more URLs for that host are still queued.
+        """
+        if not urls or max_pages <= 0:
             return []
 
         try:
+            settings = get_settings()
+            targets = list(urls)[:max_pages]
             browser_config = BrowserConfig(headless=True, verbose=False)
-            run_config = CrawlerRunConfig(cache_mode="BYPASS", stream=False)
-            dispatcher = MemoryAdaptiveDispatcher(
-                memory_threshold_percent=70.0,
-                check_interval=1.0,
-                max_session_permit=10
+            concurrency = max(1, settings.MAX_CRAWL_PAGES // 10)
+            semaphore = asyncio.Semaphore(concurrency)
+            host_semaphores: Dict[str, asyncio.Semaphore] = defaultdict(
+                lambda: asyncio.Semaphore(max(1, concurrency // 2))
             )
+            queued_per_host = Counter(urlparse(url).netloc for url in targets)
 
             async with AsyncWebCrawler(config=browser_config) as crawler:
-                results = await crawler.arun_many(
-                    urls=list(urls)[:max_pages],
-                    config=run_config,
-                    dispatcher=dispatcher
-                )
-                
-                for result in results:
-                    if result.get('success'):
-                        doc = await crawler.crawl_url(result['url'])
-                        if doc:
-                            self.crawled_documents.append(doc)
-                    else:
-                        self.logger.error(f"Failed to crawl {result['url']}: {result.get('error_message')}")
-                
+                async def crawl(url: str) -> Optional[Document]:
+                    host = urlparse(url).netloc
+                    async with host_semaphores[host]:
+                        queued_per_host[host] -= 1
+                        async with semaphore:
+                            doc = await crawler.crawl_url(url)
+                        # Pace the host without holding a global crawl slot
+                        if queued_per_host[host] > 0:
+                            await asyncio.sleep(settings.CRAWL_DELAY)
+                    return doc
+
+                results = await asyncio.gather(*(crawl(url) for url in targets))
+
+            self.crawled_documents.extend(doc for doc in results if doc)
+            self.logger.info(f"✅ Crawled {len(self.crawled_documents)}/{len(targets)} embedded links")
             return self.crawled_documents
                 
         except Exception as e:
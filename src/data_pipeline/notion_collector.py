@@ -5,7 +5,9 @@ Follows the DecodingML methodology for data collection.
 """
 
 import asyncio
+import atexit
 import re
+from functools import lru_cache
 from typing import List, Dict, Optional, Set, Any
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
@@ -19,6 +21,24 @@ from src.config.settings import settings
 from src.utils.logger import LoggerMixin
 
 
+@lru_cache(maxsize=1)
+def _get_http_adapter() -> HTTPAdapter:
+    """
+    Retrying HTTP adapter shared by every collector session.
+    
+    The urllib3 connection pool lives on the adapter, so sharing it keeps
+    TCP/TLS connections to the Notion API alive across collector instances.
+    """
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=10, pool_maxsize=50)
+    atexit.register(adapter.close)
+    return adapter
+
+
 class NotionCollector(LoggerMixin):
     """
     Collects documents from Notion workspace using the Notion API.
@@ -39,14 +59,9 @@ class NotionCollector(LoggerMixin):
             "Content-Type": "application/json"
         }
         
-        # Setup session with retry strategy
+        # Setup session with retry strategy and the shared connection pool
         self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = _get_http_adapter()
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         self.session.headers.update(self.headers)
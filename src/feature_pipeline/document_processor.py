@@ -10,6 +10,7 @@ import re
 from datetime import datetime
 import hashlib
 
+import numpy as np
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from sentence_transformers import SentenceTransformer
 
@@ -34,40 +35,52 @@ class ContentCleaner(LoggerMixin):
 
 class QualityScorer(LoggerMixin):
     """Computes quality score for a document."""
+    HEADER_PATTERN = re.compile(r'^#{1,6}\s+.+', re.MULTILINE)
+    LIST_PATTERN = re.compile(r'^\s*[-*+]\s+.+', re.MULTILINE)
+    STRUCTURE_PATTERN = re.compile(r'^#{1,6}\s+.+|^\s*[-*+]\s+.+|^\s*\d+\.\s+.+', re.MULTILINE)
+    SENTENCE_PATTERN = re.compile(r'[.!?]+')
+    CREDIBLE_DOMAINS = (
+        'yahoo', 'org', 'realmadrid', 'psg', 'inter', 'porto', 'benfica',
+        'apple', 'ai', 'nvidia', 'google', 'microsoft', 'amazon', 'meta',
+    )
+
     def score(self, document: Document) -> float:
-        if not document.content:
-            return 0.0
-        score = 0.0
-        word_count = len(document.content.split())
-        if word_count > 100:
-            length_score = min(1.0, word_count / 1000)
-            score += 0.2 * length_score
-        structure_score = 0.0
-        if document.title and len(document.title.strip()) > 5:
-            structure_score += 0.3
-        header_count = len(re.findall(r'^#{1,6}\s+.+', document.content, re.MULTILINE))
-        if header_count > 0:
-            structure_score += 0.4
-        list_count = len(re.findall(r'^\s*[-*+]\s+.+', document.content, re.MULTILINE))
-        if list_count > 0:
-            structure_score += 0.3
-        score += 0.15 * min(1.0, structure_score)
-        structure_elements = len(re.findall(r'^#{1,6}\s+.+|^\s*[-*+]\s+.+|^\s*\d+\.\s+.+', document.content, re.MULTILINE))
-        richness_score = min(1.0, structure_elements / 10)
-        score += 0.25 * richness_score
-        sentences = re.split(r'[.!?]+', document.content)
-        if sentences:
-            avg_sentence_length = sum(len(s.split()) for s in sentences) / len(sentences)
-            readability_score = max(0, 1 - abs(avg_sentence_length - 17) / 17)
-            score += 0.2 * readability_score
-        credibility_score = 0.0
+        final_score = float(self.score_batch([document])[0])
+        self.logger.debug(f"Quality score for '{document.title}': {final_score:.3f}")
+        return final_score
+
+    def score_batch(self, documents: List[Document]) -> np.ndarray:
+        """Score many documents at once; text features are combined with NumPy."""
+        if not documents:
+            return np.zeros(0, dtype=np.float64)
+        features = np.array([self._extract_features(doc) for doc in documents], dtype=np.float64)
+        has_content, word_count, has_title, has_header, has_list, structure_elements, avg_sentence_length, credibility_score = features.T
+        length_score = np.where(word_count > 100, np.minimum(1.0, word_count / 1000), 0.0)
+        structure_score = np.minimum(1.0, 0.3 * has_title + 0.4 * has_header + 0.3 * has_list)
+        richness_score = np.minimum(1.0, structure_elements / 10)
+        readability_score = np.maximum(0.0, 1 - np.abs(avg_sentence_length - 17) / 17)
+        scores = (
+            0.2 * length_score
+            + 0.15 * structure_score
+            + 0.25 * richness_score
+            + 0.2 * readability_score
+            + 0.2 * credibility_score
+        )
+        return np.where(has_content > 0, np.clip(scores, 0.0, 1.0), 0.0)
+
+    def _extract_features(self, document: Document) -> tuple:
+        content = document.content
+        if not content:
+            return (0, 0, 0, 0, 0, 0, 0, 0)
+        has_title = bool(document.title and len(document.title.strip()) > 5)
+        has_header = self.HEADER_PATTERN.search(content) is not None
+        has_list = self.LIST_PATTERN.search(content) is not None
+        structure_elements = len(self.STRUCTURE_PATTERN.findall(content))
+        sentences = self.SENTENCE_PATTERN.split(content)
+        avg_sentence_length = sum(len(s.split()) for s in sentences) / len(sentences)
         if document.source_url:
             url_str = str(document.source_url).lower()
-            credible_domains = [
-                'yahoo', 'org', 'realmadrid', 'psg', 'inter', 'porto', 'benfica',
-                'apple', 'ai', 'nvidia', 'google', 'microsoft', 'amazon', 'meta',
-            ]
-            if any(domain in url_str for domain in credible_domains):
+            if any(domain in url_str for domain in self.CREDIBLE_DOMAINS):
                 credibility_score = 0.8
             elif any(domain in url_str for domain in ['com', 'net']):
                 credibility_score = 0.6
@@ -75,10 +88,10 @@ class QualityScorer(LoggerMixin):
                 credibility_score = 0.4
         else:
             credibility_score = 0.5
-        score += 0.2 * credibility_score
-        final_score = max(0.0, min(1.0, score))
-        self.logger.debug(f"Quality score for '{document.title}': {final_score:.3f}")
-        return final_score
+        return (
+            1, len(content.split()), has_title, has_header, has_list,
+            structure_elements, avg_sentence_length, credibility_score
+        )
 
 class DocumentChunker(LoggerMixin):
     """Splits documents into chunks for vector storage."""
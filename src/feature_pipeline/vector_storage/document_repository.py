@@ -8,7 +8,7 @@ import asyncio
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from bson import ObjectId
-from pymongo.errors import DuplicateKeyError, PyMongoError
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
 
 from src.models.schemas import Document, DocumentChunk, ProcessingStatus
 from src.utils.logger import LoggerMixin
@@ -113,12 +113,14 @@ class MongoDocumentRepository(IDocumentRepository, LoggerMixin):
             self.logger.error(f"Failed to insert document: {str(e)}")
             raise RepositoryError(f"Document insertion failed: {str(e)}") from e
     
-    async def insert_documents(self, documents: List[Document]) -> List[str]:
+    async def insert_documents(self, documents: List[Document], batch_size: int = 1000) -> List[str]:
         """
-        Insert multiple documents.
+        Insert multiple documents in concurrent unordered batches.
+        Documents rejected by the server are logged and left out of the returned IDs.
         
         Args:
             documents: List of documents to insert
+            batch_size: Maximum documents per insert_many call (keeps batches under the BSON limit)
             
         Returns:
             List of document IDs
@@ -138,16 +140,59 @@ class MongoDocumentRepository(IDocumentRepository, LoggerMixin):
                 doc_dict.pop('id', None)  # Remove id field
                 doc_dicts.append(doc_dict)
             
-            result = await collection.insert_many(doc_dicts)
-            document_ids = [str(oid) for oid in result.inserted_ids]
+            batches = [
+                doc_dicts[start:start + batch_size]
+                for start in range(0, len(doc_dicts), batch_size)
+            ]
+            # Let every batch finish before reporting, so no insert runs unobserved
+            results = await asyncio.gather(
+                *(self._insert_batch(collection, batch) for batch in batches),
+                return_exceptions=True
+            )
             
-            self.logger.info(f"Inserted {len(document_ids)} documents")
+            errors = [result for result in results if isinstance(result, BaseException)]
+            document_ids = [
+                doc_id
+                for result in results if not isinstance(result, BaseException)
+                for doc_id in result
+            ]
+            
+            if errors:
+                self.logger.error(
+                    f"{len(errors)}/{len(batches)} document batches failed "
+                    f"({len(document_ids)} documents inserted): {errors[0]}"
+                )
+                raise errors[0]
+            
+            self.logger.info(f"Inserted {len(document_ids)}/{len(doc_dicts)} documents in {len(batches)} batches")
             return document_ids
             
         except PyMongoError as e:
             self.logger.error(f"Failed to insert documents: {str(e)}")
             raise RepositoryError(f"Bulk document insertion failed: {str(e)}") from e
     
+    async def _insert_batch(self, collection, doc_dicts: List[Dict[str, Any]]) -> List[str]:
+        """
+        Insert one unordered batch and return the IDs that were actually written.
+        
+        With ordered=False the server keeps inserting past bad documents, then
+        reports them in a BulkWriteError. pymongo has already set ``_id`` on
+        every dict, so the stored IDs are those not listed in ``writeErrors``.
+        """
+        try:
+            result = await collection.insert_many(doc_dicts, ordered=False)
+            return [str(oid) for oid in result.inserted_ids]
+        except BulkWriteError as e:
+            write_errors = e.details.get("writeErrors", [])
+            failed = {error["index"] for error in write_errors}
+            for error in write_errors:
+                self.logger.error(f"Failed to insert document at batch index {error['index']}: {error.get('errmsg')}")
+            return [
+                str(doc_dict["_id"])
+                for index, doc_dict in enumerate(doc_dicts)
+                if index not in failed and "_id" in doc_dict
+            ]
+    
     async def get_document(self, document_id: str) -> Optional[Document]:
         """
         Retrieve a document by ID.
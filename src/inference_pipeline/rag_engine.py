@@ -4,6 +4,7 @@ Implements Retrieval Augmented Generation with advanced search strategies,
 contextual enhancement, parent-child retrieval, and source attribution.
 """
 
+import asyncio
 import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
@@ -30,6 +31,8 @@ class RAGEngine(LoggerMixin):
         self.search_orchestrator = None  # Will be initialized in setup
         self.source_attribution = None  # Will be initialized in setup
         self.feature_flags = get_feature_flags()
+        self._is_setup = False
+        self._setup_lock: Optional[asyncio.Lock] = None  # Created lazily inside the running loop
         
         # Configuration
         self.similarity_threshold = 0.7
@@ -50,11 +53,19 @@ class RAGEngine(LoggerMixin):
         }
     
     async def setup(self):
-        """Initialize the vector store and advanced components."""
-        self.vector_store = await create_vector_store()
-        self.source_attribution = SourceAttributionService(self.vector_store)
-        self.search_orchestrator = AdvancedSearchOrchestrator(self.vector_store)
-        self.logger.info("Advanced RAG Engine initialized with all components")
+        """Initialize the vector store and advanced components (idempotent and safe under concurrency)."""
+        if self._is_setup:
+            return
+        if self._setup_lock is None:
+            self._setup_lock = asyncio.Lock()
+        async with self._setup_lock:
+            if self._is_setup:
+                return
+            self.vector_store = await create_vector_store()
+            self.source_attribution = SourceAttributionService(self.vector_store)
+            self.search_orchestrator = AdvancedSearchOrchestrator(self.vector_store)
+            self._is_setup = True
+            self.logger.info("Advanced RAG Engine initialized with all components")
     
     async def process_query(
         self,
@@ -79,8 +90,7 @@ class RAGEngine(LoggerMixin):
         
         try:
             # Ensure all components are initialized
-            if self.vector_store is None or self.source_attribution is None:
-                await self.setup()
+            await self.setup()
             
             # Update metrics
             self.metrics["total_queries"] += 1
@@ -3,14 +3,75 @@ Tools for the Second Brain AI Assistant Agent.
 Implements the three core tools: retriever, summarization, and help.
 """
 
-from typing import Dict, Any, Optional
+import asyncio
+import threading
+from functools import lru_cache
+from typing import Dict, Any, Optional, Awaitable, ClassVar, TypeVar, TYPE_CHECKING
 from langchain.tools import BaseTool
 from pydantic import Field
 
-from src.inference_pipeline.rag_engine import RAGEngine
-from src.inference_pipeline.openai_service import OpenAIService
 from src.utils.logger import LoggerMixin
 
+if TYPE_CHECKING:
+    from src.inference_pipeline.rag_engine import RAGEngine
+    from src.inference_pipeline.openai_service import OpenAIService
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=1)
+def _get_tool_loop() -> asyncio.AbstractEventLoop:
+    """
+    Long-lived event loop, running on a daemon thread, for tool coroutines.
+    
+    Async clients (e.g. the shared RAG engine's Motor client) bind to the loop
+    they are first used on, so sync tool calls must all go through this one
+    loop rather than a fresh loop per call.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="tool-event-loop", daemon=True).start()
+    return loop
+
+
+def _run_sync(coro: Awaitable[T]) -> T:
+    """Run a tool coroutine from sync code on the shared tool loop and wait for its result."""
+    loop = _get_tool_loop()
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        coro.close()
+        raise RuntimeError("Sync tool call from inside the tool event loop would deadlock; await _arun instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+async def _await_on_tool_loop(coro: Awaitable[T]) -> T:
+    """Await a coroutine on the shared tool loop, from whichever loop the caller is on."""
+    loop = _get_tool_loop()
+    if asyncio.get_running_loop() is loop:
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+
+@lru_cache(maxsize=1)
+def _get_shared_rag_engine() -> "RAGEngine":
+    """
+    RAG engine shared by all retriever tools, so setup runs once per process.
+    Only use it on the tool loop (see _await_on_tool_loop): its setup lock and
+    vector-store client bind to the loop they are first used on.
+    """
+    # Imported here so loading the tools doesn't pull in the vector store and embedding stack
+    from src.inference_pipeline.rag_engine import RAGEngine
+    return RAGEngine()
+
+
+@lru_cache(maxsize=1)
+def _get_shared_openai_service() -> "OpenAIService":
+    """OpenAI service shared by all summarization tools, created on first use."""
+    from src.inference_pipeline.openai_service import OpenAIService
+    return OpenAIService()
+
 
 class RetrieverTool(BaseTool, LoggerMixin):
     """Tool for retrieving information from the knowledge base using RAG."""
@@ -20,7 +81,11 @@ class RetrieverTool(BaseTool, LoggerMixin):
     Input should be a search query or question about the content.
     This tool performs semantic search and returns relevant information with sources."""
     
-    rag_engine: RAGEngine = Field(default_factory=RAGEngine)
+    rag_engine: Optional[Any] = Field(default=None)  # RAGEngine, resolved on first use
+    
+    SOURCE_TEMPLATE: ClassVar[str] = "- **{title}** [{source_type}/{document_type}]"
+    SOURCE_URL_TEMPLATE: ClassVar[str] = "\n  🔗 {url}"
+    SOURCE_FIELDS: ClassVar[set] = {"title", "url", "source_type", "document_type", "strategies_used"}
     
     class Config:
         arbitrary_types_allowed = True
@@ -28,36 +93,22 @@ class RetrieverTool(BaseTool, LoggerMixin):
     async def _arun(self, query: str) -> str:
         """Async implementation of the tool."""
         try:
-            # Ensure RAG engine is set up
-            if self.rag_engine.vector_store is None:
-                await self.rag_engine.setup()
+            if self.rag_engine is None:
+                self.rag_engine = _get_shared_rag_engine()
             
-            # Process the query - now returns QueryResponse object
-            result = await self.rag_engine.process_query(query)
+            # Process the query on the tool loop the engine is bound to - now returns QueryResponse object
+            result = await _await_on_tool_loop(self.rag_engine.process_query(query))
             
             # Extract response from QueryResponse object
             response = result.response
             
             # Format sources from the new structure with URLs prominently displayed
             if result.sources:
-                sources_with_urls = []
-                for source in result.sources[:3]:  # Show top 3 sources
-                    source_line = f"- **{source.title}**"
-                    
-                    # Add source type and document type
-                    if hasattr(source, 'source_type') and hasattr(source, 'document_type'):
-                        source_line += f" [{source.source_type.value}/{source.document_type.value}]"
-                    
-                    # Add URL prominently if available
-                    if source.url:
-                        source_line += f"\n  🔗 {str(source.url)}"
-                    
-                    # Add search strategies used
-                    if hasattr(source, 'strategies_used') and source.strategies_used:
-                        strategies = ", ".join(source.strategies_used)
-                        source_line += f"\n  📊 Found via: {strategies}"
-                    
-                    sources_with_urls.append(source_line)
+                source_dicts = [
+                    source.model_dump(mode="json", include=self.SOURCE_FIELDS)
+                    for source in result.sources[:3]  # Show top 3 sources
+                ]
+                sources_with_urls = [self._format_source(source) for source in source_dicts]
                 
                 # Add confidence score if available
                 confidence_info = f" (Confidence: {result.confidence_score:.2f})" if result.confidence_score else ""
@@ -73,9 +124,18 @@ class RetrieverTool(BaseTool, LoggerMixin):
             self.logger.error(f"Error in retriever tool: {str(e)}")
             return f"Sorry, I encountered an error while searching: {str(e)}"
     
+    def _format_source(self, source: Dict[str, Any]) -> str:
+        """Format one dumped source attribution, with its URL and search strategies if present."""
+        source_line = self.SOURCE_TEMPLATE.format_map(source)
+        if source.get("url") is not None:
+            source_line += self.SOURCE_URL_TEMPLATE.format_map(source)
+        if source.get("strategies_used"):
+            source_line += "\n  📊 Found via: " + ", ".join(source["strategies_used"])
+        return source_line
+    
     def _run(self, query: str) -> str:
-        """Sync wrapper - not implemented for async tool."""
-        raise NotImplementedError("This tool only supports async operation")
+        """Sync wrapper that delegates to the async implementation."""
+        return _run_sync(self._arun(query))
 
 
 class SummarizationTool(BaseTool, LoggerMixin):
@@ -86,7 +146,7 @@ class SummarizationTool(BaseTool, LoggerMixin):
     Input should be the text content you want to summarize.
     This tool creates concise summaries focusing on key points."""
     
-    openai_service: OpenAIService = Field(default_factory=OpenAIService)
+    openai_service: Optional[Any] = Field(default=None)  # OpenAIService, resolved on first use
     
     class Config:
         arbitrary_types_allowed = True
@@ -101,6 +161,9 @@ class SummarizationTool(BaseTool, LoggerMixin):
 
 Summary:"""
 
+            if self.openai_service is None:
+                self.openai_service = _get_shared_openai_service()
+            
             # Generate summary using OpenAI
             result = self.openai_service.generate_response(
                 prompt=prompt,
@@ -116,5 +179,5 @@ Summary:"""
             return f"Sorry, I couldn't summarize the content: {str(e)}"
     
     def _run(self, content: str) -> str:
-        """Sync wrapper - not implemented for async tool."""
-        raise NotImplementedError("This tool only supports async operation")
\ No newline at end of file
+        """Sync wrapper that delegates to the async implementation."""
+        return _run_sync(self._arun(content))
\ No newline at end of file
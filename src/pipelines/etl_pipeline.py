@@ -4,46 +4,94 @@ from src.data_pipeline.integrated_collector import NotionDataCollector, WebDataC
 from src.feature_pipeline.document_processor import ContentCleaner, QualityScorer, DocumentChunker, EmbeddingGenerator
 from src.feature_pipeline.vector_storage import create_vector_store
 from src.models.schemas import Document, DocumentChunk, ProcessingStatus, ContentSource
-from src.config.settings import settings
+from src.config.settings import get_settings
+from src.utils.url_utils import canonicalize_url
+from src.pipelines.materializers import DocumentListMaterializer, DOCUMENT_LIST_ADAPTER
 import asyncio
-from datetime import datetime
-import json
+import atexit
+import os
+from functools import lru_cache
+from datetime import datetime, timezone
+import orjson
 
-# Step 1: Collect Notion Documents
-@step
-def collect_notion_documents(
-    notion_api_key: Optional[str] = None,
-    notion_database_id: Optional[str] = None,
-    search_query: str = ""
-) -> Tuple[List[Document], Set[str]]:
-    """Step to collect documents from Notion"""
-    collector = NotionDataCollector()
-    notion_docs, embedded_urls = asyncio.run(collector.collect(
+@lru_cache(maxsize=1)
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Event loop shared by every step, so async clients survive across steps"""
+    loop = asyncio.new_event_loop()
+    atexit.register(loop.close)
+    return loop
+
+def _run(coro):
+    """Run a coroutine to completion on the shared event loop"""
+    return _get_event_loop().run_until_complete(coro)
+
+@lru_cache(maxsize=1)
+def _get_vector_store():
+    """Create and initialize the MongoDB vector store once per process"""
+    vector_store = _run(create_vector_store(
+        initialize=True,
+        setup_indexes=True
+    ))
+    atexit.register(lambda: _run(vector_store.close()))
+    return vector_store
+
+@lru_cache(maxsize=1)
+def _get_scorer() -> QualityScorer:
+    """Quality scorer shared across pipeline runs"""
+    return QualityScorer()
+
+def _write_file_durably(path, payload: bytes) -> None:
+    """Write bytes with raw os calls (no text codec, close-on-exec) and fsync once at the end"""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+async def _collect_all(
+    notion_api_key: Optional[str],
+    notion_database_id: Optional[str],
+    search_query: str,
+    max_pages: int
+) -> Tuple[List[Document], List[Document]]:
+    """Collect Notion documents and crawl their embedded links on one event loop"""
+    notion_docs, embedded_urls = await NotionDataCollector().collect(
         api_key=notion_api_key,
         database_id=notion_database_id,
         search_query=search_query
-    ))
-    return notion_docs, set(embedded_urls)
+    )
+    if not embedded_urls or max_pages <= 0:
+        return notion_docs, []
 
-# Step 2: Crawl Embedded Links
-@step
-def crawl_embedded_links(
-    embedded_urls: Set[str],
+    crawled_docs = await WebDataCollector().collect(
+        # Dedupe on the canonical key but crawl (and record) the links as written in Notion
+        urls=set({canonicalize_url(url): url for url in embedded_urls}.values()),
+        max_pages=max_pages
+    )
+    return notion_docs, crawled_docs
+
+# Step 1: Collect Notion Documents and Crawl Embedded Links
+@step(output_materializers=DocumentListMaterializer)
+def collect_documents(
+    notion_api_key: Optional[str] = None,
+    notion_database_id: Optional[str] = None,
+    search_query: str = "",
     max_pages: int = 1000
-) -> List[Document]:
-    """Step to crawl embedded links"""
-    if not embedded_urls:
-        return []
-        
-    collector = WebDataCollector()
-    crawled_docs = asyncio.run(collector.collect(
-        urls=embedded_urls,
+) -> Tuple[List[Document], List[Document]]:
+    """Step to collect documents from Notion and crawl their embedded links"""
+    return _run(_collect_all(
+        notion_api_key=notion_api_key,
+        notion_database_id=notion_database_id,
+        search_query=search_query,
         max_pages=max_pages
     ))
-    return crawled_docs
 
-# Step 3: Combine Documents
-@step
+# Step 2: Combine Documents
+@step(output_materializers=DocumentListMaterializer)
 def combine_documents(
     notion_documents: List[Document],
     crawled_documents: List[Document]
@@ -53,18 +101,18 @@ def combine_documents(
     all_docs, _ = combiner.combine(notion_documents, crawled_documents)
     return all_docs
 
-# Step 4: Compute Quality Score
-@step
+# Step 3: Compute Quality Score
+@step(output_materializers=DocumentListMaterializer)
 def compute_quality_score(documents: List[Document]) -> List[Document]:
     """Step to compute quality scores for documents."""
-    scorer = QualityScorer()
-    for doc in documents:
-        doc.quality_score = scorer.score(doc)
+    scores = _get_scorer().score_batch(documents)
+    for doc, score in zip(documents, scores):
+        doc.quality_score = float(score)
         # Keep all documents - filtering will happen in RAG pipeline
         doc.processing_status = ProcessingStatus.COMPLETED
     return documents
 
-# Step 4b: Clean Content (COMMENTED OUT - used in RAG pipeline)
+# Step 3b: Clean Content (COMMENTED OUT - used in RAG pipeline)
 # @step
 # def clean_content(documents: List[Document]) -> List[Document]:
 #     cleaner = ContentCleaner()
@@ -72,7 +120,7 @@ def compute_quality_score(documents: List[Document]) -> List[Document]:
 #         doc.content = cleaner.clean(doc.content)
 #     return documents
 
-# Step 4d: Chunk Documents (COMMENTED OUT - used in RAG pipeline)
+# Step 3d: Chunk Documents (COMMENTED OUT - used in RAG pipeline)
 # @step
 # def chunk_document(documents: List[Document]) -> List[Dict[str, Any]]:
 #     chunker = DocumentChunker()
@@ -89,11 +137,12 @@ def compute_quality_score(documents: List[Document]) -> List[Document]:
 #         })
 #     return chunked
 
-# Step 4e: Generate Embeddings (COMMENTED OUT - used in RAG pipeline)
+# Step 3e: Generate Embeddings (COMMENTED OUT - used in RAG pipeline)
 # @step
 # def generate_embeddings(chunked_docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 #     embedder = EmbeddingGenerator()
 #     processed_documents = []
+#     now = datetime.now(timezone.utc)
 #     for doc_data in chunked_docs:
 #         document = doc_data["document"]
 #         chunks = doc_data["chunks"]
@@ -102,7 +151,7 @@ def compute_quality_score(documents: List[Document]) -> List[Document]:
 #             continue
 #         chunks_with_embeddings = asyncio.run(embedder.generate(chunks))
 #         document.processing_status = ProcessingStatus.COMPLETED
-#         document.updated_at = datetime.utcnow()
+#         document.updated_at = now
 #         processed_data = {
 #             "document": document,
 #             "chunks": chunks_with_embeddings,
@@ -113,7 +162,7 @@ def compute_quality_score(documents: List[Document]) -> List[Document]:
 #         processed_documents.append(processed_data)
 #     return processed_documents
 
-# Step 5a: Store to MongoDB
+# Step 4a: Store to MongoDB
 @step
 def store_to_mongodb(
     documents: List[Document],
@@ -122,35 +171,26 @@ def store_to_mongodb(
     """Step to store processed data to MongoDB"""
     if should_store_to_mongodb:
         try:
-            # Create a new event loop for this step
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            vector_store = loop.run_until_complete(create_vector_store(
-                initialize=True,
-                setup_indexes=True
-            ))
+            vector_store = _get_vector_store()
             
             # Update documents with completed status
+            now = datetime.now(timezone.utc)
             for document in documents:
                 document.processing_status = ProcessingStatus.COMPLETED
-                document.updated_at = datetime.utcnow()
+                document.updated_at = now
                 
             if documents:
                 # Store documents using document repository directly
-                document_ids = loop.run_until_complete(
+                document_ids = _run(
                     vector_store.document_repo.insert_documents(documents)
                 )
                 print(f"Successfully stored {len(document_ids)} documents to MongoDB")
             
-            loop.run_until_complete(vector_store.close())
-            loop.close()
-            
         except Exception as e:
             print(f"Error storing to MongoDB: {str(e)}")
             pass
 
-# Step 5b: Save Local Backup
+# Step 4b: Save Local Backup
 @step
 def save_local_backup(
     documents: List[Document],
@@ -159,25 +199,27 @@ def save_local_backup(
     """Step to save processed data as local backup"""
     if should_save_local_backup:
         try:
-            data_dir = settings.DATA_DIR / "processed"
+            data_dir = get_settings().DATA_DIR / "processed"
             data_dir.mkdir(parents=True, exist_ok=True)
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+            iso_timestamp = datetime.now(timezone.utc).isoformat()
+            # "2024-01-31T12:34:56.789+00:00" -> "20240131_123456"
+            timestamp = iso_timestamp[:19].replace("-", "").replace(":", "").replace("T", "_")
             backup_file = data_dir / f"second_brain_backup_{timestamp}.json"
             backup_data = {
                 "metadata": {
-                    "backup_timestamp": datetime.utcnow().isoformat(),
+                    "backup_timestamp": iso_timestamp,
                     "total_documents": len(documents),
                 },
-                "documents": []
+                "documents": [
+                    {
+                        "document": doc_dict,
+                        "quality_score": doc_dict["quality_score"]
+                    }
+                    for doc_dict in DOCUMENT_LIST_ADAPTER.dump_python(documents, mode="json")
+                ]
             }
-            for document in documents:
-                doc_dict = document.dict() if hasattr(document, 'dict') else document
-                backup_data["documents"].append({
-                    "document": doc_dict,
-                    "quality_score": getattr(document, 'quality_score', 0.0)
-                })
-            with open(backup_file, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, indent=2, ensure_ascii=False, default=str)
+            payload = orjson.dumps(backup_data, option=orjson.OPT_INDENT_2, default=str)
+            _write_file_durably(backup_file, payload)
         except Exception:
             pass
 
@@ -197,35 +239,30 @@ def etl_pipeline(
     and stores enhanced documents to MongoDB. Documents are already in markdown format
     from data collection, so no markdown conversion is needed.
     """
-    # Step 1: Collect Notion documents
-    notion_docs, embedded_urls = collect_notion_documents(
+    # Step 1: Collect Notion documents and crawl embedded links
+    notion_docs, crawled_docs = collect_documents(
         notion_api_key=notion_api_key,
-        notion_database_id=notion_database_id
-    )
-    
-    # Step 2: Crawl embedded links
-    crawled_docs = crawl_embedded_links(
-        embedded_urls=embedded_urls,
+        notion_database_id=notion_database_id,
         max_pages=max_crawl_pages
     )
     
-    # Step 3: Combine documents
+    # Step 2: Combine documents
     combined_docs = combine_documents(
         notion_documents=notion_docs,
         crawled_documents=crawled_docs
     )
     
-    # Step 4: Compute quality score
+    # Step 3: Compute quality score
     # Note: Documents are already in markdown format from data collection
     scored_docs = compute_quality_score(documents=combined_docs)
     
-    # Step 5a: Store to MongoDB
+    # Step 4a: Store to MongoDB
     store_to_mongodb(
         documents=scored_docs,
         should_store_to_mongodb=should_store_to_mongodb
     )
     
-    # Step 5b: Save local backup
+    # Step 4b: Save local backup
     save_local_backup(
         documents=scored_docs,
         should_save_local_backup=should_save_local_backup
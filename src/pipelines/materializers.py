@@ -0,0 +1,65 @@
+"""
+ZenML materializers for the Second Brain AI Assistant pipelines.
+Stores lists of Document models as columnar Parquet instead of pickles.
+"""
+
+import os
+from typing import Any, ClassVar, List, Tuple, Type
+
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pydantic import TypeAdapter
+from zenml.enums import ArtifactType
+from zenml.materializers.base_materializer import BaseMaterializer
+
+from src.models.schemas import Document
+
+DOCUMENT_LIST_ADAPTER = TypeAdapter(List[Document])
+
+DOCUMENTS_SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("title", pa.string()),
+    ("content", pa.string()),
+    ("source", pa.string()),
+    ("source_url", pa.string()),
+    ("document_type", pa.string()),
+    ("metadata", pa.string()),  # JSON-encoded; Notion metadata is free-form
+    ("created_at", pa.string()),
+    ("updated_at", pa.string()),
+    ("processing_status", pa.string()),
+    ("error_message", pa.string()),
+    ("quality_score", pa.float64()),
+    ("word_count", pa.int64()),
+])
+
+
+class DocumentListMaterializer(BaseMaterializer):
+    """
+    Materializes List[Document] step outputs as a zstd-compressed Parquet table.
+    
+    Typed fields round-trip exactly. ``metadata`` is stored as JSON, so values
+    inside it come back in their JSON form (e.g. datetimes as ISO strings),
+    unlike the default pickle materializer.
+    """
+
+    ASSOCIATED_TYPES: ClassVar[Tuple[Type[Any], ...]] = (list,)
+    ASSOCIATED_ARTIFACT_TYPE: ClassVar[ArtifactType] = ArtifactType.DATA
+    FILENAME: ClassVar[str] = "documents.parquet"
+
+    def load(self, data_type: Type[Any]) -> List[Document]:
+        """Read the Parquet table back into Document models."""
+        with self.artifact_store.open(os.path.join(self.uri, self.FILENAME), "rb") as f:
+            rows = pq.read_table(f).to_pylist()
+        for row in rows:
+            row["metadata"] = orjson.loads(row["metadata"])
+        return DOCUMENT_LIST_ADAPTER.validate_python(rows)
+
+    def save(self, data: List[Document]) -> None:
+        """Write the documents as one row per document."""
+        rows = DOCUMENT_LIST_ADAPTER.dump_python(data, mode="json")
+        for row in rows:
+            row["metadata"] = orjson.dumps(row["metadata"]).decode()
+        table = pa.Table.from_pylist(rows, schema=DOCUMENTS_SCHEMA)
+        with self.artifact_store.open(os.path.join(self.uri, self.FILENAME), "wb") as f:
+            pq.write_table(table, f, compression="zstd")
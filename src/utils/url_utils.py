@@ -0,0 +1,46 @@
+"""
+URL helpers for the Second Brain AI Assistant.
+Provides canonical keys for deduplicating crawled links.
+"""
+
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+
+@lru_cache(maxsize=4096)
+def canonicalize_url(url: str) -> str:
+    """
+    Build a dedup key for a URL so trivial variants are crawled once.
+    
+    The key lowercases the scheme and host, strips trailing slashes, drops
+    utm_* query parameters and plain #anchors. Userinfo, the remaining query
+    and hash-route fragments (#/... or #!...) are kept as written. The key is
+    only for comparison; crawl the original URL.
+    
+    Args:
+        url: URL as it appeared in the source document
+    
+    Returns:
+        Canonical form of the URL
+    """
+    parts = urlsplit(url)
+    
+    userinfo, at, hostport = parts.netloc.rpartition("@")
+    netloc = userinfo + at + hostport.lower()
+    
+    query = parts.query
+    params = parse_qsl(query, keep_blank_values=True)
+    kept = [(key, value) for key, value in params if not key.startswith("utm_")]
+    if len(kept) != len(params):
+        query = urlencode(kept)
+    
+    # Hash routes address different pages in JS-rendered sites; plain anchors don't
+    fragment = parts.fragment if parts.fragment.startswith(("/", "!")) else ""
+    
+    return urlunsplit((
+        parts.scheme.lower(),
+        netloc,
+        parts.path.rstrip("/") or "/",
+        query,
+        fragment
+    ))
@@ -0,0 +1,97 @@
+"""
+Tests for MongoDB document repository batching.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from src.feature_pipeline.vector_storage.document_repository import MongoDocumentRepository
+from src.models.schemas import Document, ContentSource, DocumentType
+
+
+def _make_documents(count: int):
+    return [
+        Document(
+            title=f"Document {i}",
+            content=f"Content {i}",
+            source=ContentSource.WEB_CRAWL,
+            document_type=DocumentType.WEB_PAGE
+        )
+        for i in range(count)
+    ]
+
+
+class FakeCollection:
+    """Mimics Motor's insert_many: assigns _id in place and rejects titles listed in fail_titles."""
+
+    def __init__(self, fail_titles=()):
+        self.fail_titles = set(fail_titles)
+        self.batches = []
+        self.seen = []
+
+    async def insert_many(self, doc_dicts, ordered=True):
+        self.batches.append((len(doc_dicts), ordered))
+        self.seen.extend(doc_dicts)
+        write_errors = []
+        for index, doc_dict in enumerate(doc_dicts):
+            doc_dict.setdefault("_id", ObjectId())
+            if doc_dict["title"] in self.fail_titles:
+                write_errors.append({"index": index, "code": 11000, "errmsg": "duplicate key"})
+        if write_errors:
+            raise BulkWriteError({"writeErrors": write_errors, "nInserted": len(doc_dicts) - len(write_errors)})
+        result = MagicMock()
+        result.inserted_ids = [doc_dict["_id"] for doc_dict in doc_dicts]
+        return result
+
+
+def _make_repository(collection: FakeCollection) -> MongoDocumentRepository:
+    connection = MagicMock()
+    connection.get_collection.return_value = collection
+    return MongoDocumentRepository(connection)
+
+
+class TestInsertDocuments:
+    """Test batched document insertion."""
+
+    def test_splits_into_unordered_batches(self):
+        """Test that documents are inserted in batch_size chunks with ordered=False."""
+        collection = FakeCollection()
+        repository = _make_repository(collection)
+
+        document_ids = asyncio.run(repository.insert_documents(_make_documents(5), batch_size=2))
+
+        assert len(document_ids) == 5
+        assert len(set(document_ids)) == 5
+        assert sorted(collection.batches) == [(1, False), (2, False), (2, False)]
+
+    def test_partial_failure_returns_inserted_ids(self):
+        """Test that rejected documents are dropped while the rest of their batch is reported."""
+        collection = FakeCollection(fail_titles={"Document 1", "Document 4"})
+        repository = _make_repository(collection)
+
+        document_ids = asyncio.run(repository.insert_documents(_make_documents(5), batch_size=2))
+
+        expected_ids = {
+            str(doc_dict["_id"])
+            for doc_dict in collection.seen
+            if doc_dict["title"] not in {"Document 1", "Document 4"}
+        }
+        assert len(document_ids) == 3
+        assert set(document_ids) == expected_ids
+        assert len(collection.batches) == 3
+
+    def test_empty_input(self):
+        """Test that no insert is attempted for an empty list."""
+        collection = FakeCollection()
+        repository = _make_repository(collection)
+
+        assert asyncio.run(repository.insert_documents([])) == []
+        assert collection.batches == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,95 @@
+"""
+Tests for ZenML materializers.
+"""
+
+import builtins
+from datetime import datetime, timezone
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+from src.pipelines.materializers import DOCUMENTS_SCHEMA, DocumentListMaterializer
+from src.models.schemas import Document, ContentSource, DocumentType, ProcessingStatus
+
+
+class LocalArtifactStore:
+    """Stub artifact store that reads and writes the local filesystem."""
+
+    def open(self, path, mode="r"):
+        return builtins.open(path, mode)
+
+
+class TestDocumentListMaterializer:
+    """Test Parquet round-trips of document lists."""
+
+    @pytest.fixture(autouse=True)
+    def local_artifact_store(self):
+        with patch.object(
+            DocumentListMaterializer,
+            "artifact_store",
+            new_callable=PropertyMock,
+            return_value=LocalArtifactStore()
+        ):
+            yield
+
+    def test_schema_matches_document_fields(self):
+        """Test that the Parquet schema has a column for every Document field, in order."""
+        assert DOCUMENTS_SCHEMA.names == list(Document.model_fields)
+
+    def test_round_trip(self, tmp_path):
+        """Test that save followed by load returns equal documents."""
+        documents = [
+            Document(
+                id="notion_1",
+                title="Notion page",
+                content="# Title\n\nBody",
+                source=ContentSource.NOTION,
+                source_url="https://www.notion.so/page-1",
+                document_type=DocumentType.NOTION_PAGE,
+                metadata={"embedded_links": ["https://example.com"], "properties": {"tags": [1, None]}},
+                processing_status=ProcessingStatus.COMPLETED,
+                quality_score=0.42,
+                word_count=3,
+                updated_at=datetime(2024, 1, 31, 12, 0, tzinfo=timezone.utc)
+            ),
+            Document(
+                title="Crawled page",
+                content="Text",
+                source=ContentSource.WEB_CRAWL,
+                document_type=DocumentType.WEB_PAGE
+            ),
+        ]
+
+        materializer = DocumentListMaterializer(uri=str(tmp_path))
+        materializer.save(documents)
+        loaded = materializer.load(list)
+
+        assert loaded == documents
+
+    def test_empty_list(self, tmp_path):
+        """Test that an empty list round-trips."""
+        materializer = DocumentListMaterializer(uri=str(tmp_path))
+        materializer.save([])
+
+        assert materializer.load(list) == []
+
+    def test_metadata_values_come_back_as_json(self, tmp_path):
+        """Test that datetimes inside metadata are returned as ISO strings."""
+        timestamp = datetime(2024, 1, 31, 12, 0, tzinfo=timezone.utc)
+        document = Document(
+            title="Page",
+            content="Text",
+            source=ContentSource.NOTION,
+            document_type=DocumentType.NOTION_PAGE,
+            metadata={"collected_at": timestamp}
+        )
+
+        materializer = DocumentListMaterializer(uri=str(tmp_path))
+        materializer.save([document])
+        loaded = materializer.load(list)
+
+        assert loaded[0].metadata["collected_at"] == "2024-01-31T12:00:00Z"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,72 @@
+"""
+Tests for Quality Scorer.
+"""
+
+import pytest
+
+from src.feature_pipeline.document_processor import QualityScorer
+from src.models.schemas import Document, ContentSource, DocumentType
+
+
+def _make_document(content: str, title: str = "Test Document", source_url=None) -> Document:
+    return Document(
+        title=title,
+        content=content,
+        source=ContentSource.WEB_CRAWL,
+        source_url=source_url,
+        document_type=DocumentType.WEB_PAGE
+    )
+
+
+class TestQualityScorer:
+    """Test quality scoring functionality."""
+
+    def test_empty_content_scores_zero(self):
+        """Test that documents without content get a zero score."""
+        scorer = QualityScorer()
+
+        assert scorer.score(_make_document("")) == 0.0
+        assert scorer.score_batch([_make_document("")]).tolist() == [0.0]
+
+    def test_score_batch_empty_list(self):
+        """Test that an empty batch returns an empty array."""
+        scorer = QualityScorer()
+
+        assert len(scorer.score_batch([])) == 0
+
+    def test_scores_match_reference_values(self):
+        """Test batch and single scoring against scores from the original per-document implementation."""
+        scorer = QualityScorer()
+        documents = [
+            _make_document("# Heading\n\n- item one\n- item two\n\nA short sentence. Another one!"),
+            _make_document(" ".join(["word"] * 500) + ".", title="Tiny", source_url="https://example.org/post"),
+            _make_document("1. first\n2. second\n\nPlain text here.", source_url="https://example.com"),
+            _make_document("x"),
+            _make_document(""),
+        ]
+        expected_scores = [
+            0.37598039215686274,
+            0.26,
+            0.23558823529411765,
+            0.15676470588235294,
+            0.0,
+        ]
+
+        batch_scores = scorer.score_batch(documents)
+
+        assert batch_scores.tolist() == pytest.approx(expected_scores, abs=1e-12)
+        for document, expected in zip(documents, expected_scores):
+            assert scorer.score(document) == pytest.approx(expected, abs=1e-12)
+
+    def test_structured_content_scores_higher(self):
+        """Test that structured content outranks unstructured content."""
+        scorer = QualityScorer()
+        structured = _make_document("# Title\n\n- one\n- two\n- three\n\nThis is a sentence of reasonable length here.")
+        unstructured = _make_document("x")
+
+        structured_score, unstructured_score = scorer.score_batch([structured, unstructured])
+        assert structured_score > unstructured_score
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
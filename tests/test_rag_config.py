@@ -5,6 +5,7 @@ Tests for RAG configuration system.
 import pytest
 import tempfile
 import os
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -309,7 +310,7 @@ search:
                 assert config.search.similarity_threshold == 0.75
                 
                 # Test feature flags integration
-                with patch('src.config.settings.settings.RAG_CONFIG_PATH', f.name):
+                with patch('src.config.feature_flags.settings', replace(settings, RAG_CONFIG_PATH=f.name)):
                     flags = get_feature_flags()
                     flags.refresh_flags()  # Force reload
                     
@@ -0,0 +1,45 @@
+"""
+Tests for RAG Engine setup.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.inference_pipeline.rag_engine import RAGEngine
+
+
+@pytest.fixture
+def engine():
+    with patch("src.inference_pipeline.rag_engine.OpenAIService"), \
+         patch("src.inference_pipeline.rag_engine.PromptManager"), \
+         patch("src.inference_pipeline.rag_engine.get_feature_flags"):
+        yield RAGEngine()
+
+
+class TestRAGEngineSetup:
+    """Test RAG engine initialization."""
+
+    def test_concurrent_setup_creates_vector_store_once(self, engine):
+        """Test that concurrent setup calls share a single vector store."""
+        async def slow_create_vector_store():
+            await asyncio.sleep(0.01)
+            return MagicMock()
+
+        create_vector_store = AsyncMock(side_effect=slow_create_vector_store)
+
+        async def setup_twice():
+            await asyncio.gather(engine.setup(), engine.setup())
+
+        with patch("src.inference_pipeline.rag_engine.create_vector_store", create_vector_store), \
+             patch("src.inference_pipeline.rag_engine.SourceAttributionService"), \
+             patch("src.inference_pipeline.rag_engine.AdvancedSearchOrchestrator"):
+            asyncio.run(setup_twice())
+
+        create_vector_store.assert_awaited_once()
+        assert engine.vector_store is not None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
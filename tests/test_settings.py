@@ -0,0 +1,51 @@
+"""
+Tests for application settings.
+"""
+
+import dataclasses
+import pickle
+from typing import get_type_hints
+
+import pytest
+
+from src.config.settings import ResolvedSettings, Settings, get_settings
+
+
+class TestResolvedSettings:
+    """Test the immutable settings snapshot."""
+
+    def test_fields_mirror_settings_model(self):
+        """Test that ResolvedSettings declares exactly the Settings fields, with the same types."""
+        resolved_types = get_type_hints(ResolvedSettings)
+
+        assert [field.name for field in dataclasses.fields(ResolvedSettings)] == list(Settings.model_fields)
+        for name, field in Settings.model_fields.items():
+            assert resolved_types[name] == field.annotation, name
+
+    def test_get_settings_is_cached_snapshot(self):
+        """Test that get_settings returns one shared ResolvedSettings instance."""
+        settings = get_settings()
+
+        assert isinstance(settings, ResolvedSettings)
+        assert get_settings() is settings
+
+    def test_snapshot_is_frozen(self):
+        """Test that settings cannot be mutated in place."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            get_settings().PORT = 1
+
+    def test_snapshot_pickles(self):
+        """Test that the snapshot survives pickling (e.g. into worker processes)."""
+        settings = get_settings()
+
+        assert pickle.loads(pickle.dumps(settings)) == settings
+
+    def test_legacy_module_attribute(self):
+        """Test that the legacy module-level settings name resolves to the snapshot."""
+        from src.config.settings import settings
+
+        assert settings is get_settings()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,69 @@
+"""
+Tests for agent tools.
+"""
+
+import asyncio
+import pytest
+
+from src.inference_pipeline.tools import RetrieverTool, _get_tool_loop
+from src.models.schemas import QueryResponse
+
+
+class LoopBoundRAGEngine:
+    """Fake RAG engine that, like a Motor client, only works on the loop it was first used on."""
+
+    def __init__(self):
+        self.loop = None
+        self.queries = []
+
+    async def process_query(self, query: str) -> QueryResponse:
+        loop = asyncio.get_running_loop()
+        if self.loop is None:
+            self.loop = loop
+        elif self.loop is not loop or self.loop.is_closed():
+            raise RuntimeError("Event loop is closed")
+        self.queries.append(query)
+        return QueryResponse(response=f"answer to {query}")
+
+
+class TestRetrieverTool:
+    """Test sync and async retriever tool calls."""
+
+    def test_sync_run_twice_reuses_loop(self):
+        """Test that repeated sync calls run on the same long-lived loop."""
+        engine = LoopBoundRAGEngine()
+        tool = RetrieverTool(rag_engine=engine)
+
+        first = tool._run("first question")
+        second = tool._run("second question")
+
+        assert first == "answer to first question"
+        assert second == "answer to second question"
+        assert engine.queries == ["first question", "second question"]
+        assert not engine.loop.is_closed()
+
+    def test_sync_run_from_running_loop(self):
+        """Test that a sync call made while another loop is running still completes."""
+        engine = LoopBoundRAGEngine()
+        tool = RetrieverTool(rag_engine=engine)
+
+        async def call_sync():
+            return tool._run("question")
+
+        assert asyncio.run(call_sync()) == "answer to question"
+
+    def test_async_run_from_foreign_loops_uses_tool_loop(self):
+        """Test that async calls from different loops all reach the engine on the tool loop."""
+        engine = LoopBoundRAGEngine()
+        tool = RetrieverTool(rag_engine=engine)
+
+        first = asyncio.run(tool._arun("first question"))
+        second = asyncio.run(tool._arun("second question"))
+
+        assert first == "answer to first question"
+        assert second == "answer to second question"
+        assert engine.loop is _get_tool_loop()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
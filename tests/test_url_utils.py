@@ -0,0 +1,41 @@
+"""
+Tests for URL canonicalization.
+"""
+
+import pytest
+
+from src.utils.url_utils import canonicalize_url
+
+
+class TestCanonicalizeUrl:
+    """Test canonical dedup keys for crawled links."""
+
+    def test_strips_utm_params(self):
+        """Test that utm_* parameters are removed and other parameters kept."""
+        assert canonicalize_url("https://example.com/post?utm_source=notion&id=3&utm_medium=x") == "https://example.com/post?id=3"
+        assert canonicalize_url("https://example.com/post?utm_source=notion") == "https://example.com/post"
+
+    def test_strips_trailing_slash(self):
+        """Test that trailing slashes collapse but the root path stays."""
+        assert canonicalize_url("https://example.com/post/") == canonicalize_url("https://example.com/post")
+        assert canonicalize_url("https://example.com") == "https://example.com/"
+        assert canonicalize_url("https://example.com/") == "https://example.com/"
+
+    def test_lowercases_scheme_and_host_only(self):
+        """Test that scheme and host are lowercased while userinfo and path keep their case."""
+        assert canonicalize_url("HTTPS://Example.COM:8080/Path") == "https://example.com:8080/Path"
+        assert canonicalize_url("https://User:PW@Example.com/a") == "https://User:PW@example.com/a"
+
+    def test_query_without_utm_is_untouched(self):
+        """Test that a query without utm_* parameters is not re-encoded."""
+        assert canonicalize_url("https://example.com/search?q=a%20b&flag") == "https://example.com/search?q=a%20b&flag"
+
+    def test_fragments(self):
+        """Test that plain anchors are dropped but hash routes are kept."""
+        assert canonicalize_url("https://example.com/doc#section") == "https://example.com/doc"
+        assert canonicalize_url("https://app.example.com/#/route") == "https://app.example.com/#/route"
+        assert canonicalize_url("https://app.example.com/#/a") != canonicalize_url("https://app.example.com/#/b")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
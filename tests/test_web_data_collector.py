@@ -0,0 +1,101 @@
+"""
+Tests for WebDataCollector crawl scheduling.
+"""
+
+import asyncio
+import dataclasses
+import pytest
+from unittest.mock import patch
+
+from src.config.settings import get_settings
+from src.data_pipeline.integrated_collector import WebDataCollector
+from src.models.schemas import Document, ContentSource, DocumentType
+
+
+class FakeCrawler:
+    """Stands in for AsyncWebCrawler and records how many fetches overlap."""
+
+    instances = []
+
+    def __init__(self, config=None):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.crawled = []
+        FakeCrawler.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+    async def crawl_url(self, url: str) -> Document:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.crawled.append(url)
+        return Document(
+            title=url,
+            content="content",
+            source=ContentSource.WEB_CRAWL,
+            document_type=DocumentType.WEB_PAGE
+        )
+
+
+def _collect(urls, max_pages=1000, max_crawl_pages=100, crawl_delay=0.0):
+    FakeCrawler.instances = []
+    settings = dataclasses.replace(get_settings(), MAX_CRAWL_PAGES=max_crawl_pages, CRAWL_DELAY=crawl_delay)
+    with patch("src.data_pipeline.integrated_collector.AsyncWebCrawler", FakeCrawler), \
+         patch("src.data_pipeline.integrated_collector.get_settings", return_value=settings):
+        return asyncio.run(asyncio.wait_for(WebDataCollector().collect(urls, max_pages=max_pages), timeout=2))
+
+
+class TestWebDataCollector:
+    """Test crawl concurrency limits."""
+
+    def test_max_pages_zero_short_circuits(self):
+        """Test that no crawler is started when max_pages <= 0."""
+        assert _collect({"https://a.com/1"}, max_pages=0) == []
+        assert _collect({"https://a.com/1"}, max_pages=-1) == []
+        assert FakeCrawler.instances == []
+
+    def test_global_concurrency_cap(self):
+        """Test that at most MAX_CRAWL_PAGES // 10 fetches run at once."""
+        urls = {f"https://host{i}.com/page" for i in range(12)}
+
+        documents = _collect(urls, max_crawl_pages=30)
+
+        assert len(documents) == 12
+        assert FakeCrawler.instances[0].max_in_flight == 3
+
+    def test_same_host_still_runs_concurrently(self):
+        """Test that one host gets several slots rather than being serialized."""
+        urls = {f"https://same.com/page{i}" for i in range(8)}
+
+        documents = _collect(urls, max_crawl_pages=40)
+
+        assert len(documents) == 8
+        assert FakeCrawler.instances[0].max_in_flight == 2
+
+    def test_no_delay_after_last_url_of_host(self):
+        """Test that CRAWL_DELAY is not waited out once a host has nothing queued."""
+        urls = {f"https://host{i}.com/page" for i in range(5)}
+
+        # Would exceed the 2s timeout if any host slept after its only URL
+        documents = _collect(urls, crawl_delay=5.0)
+
+        assert len(documents) == 5
+
+    def test_max_pages_limits_targets(self):
+        """Test that only max_pages URLs are crawled."""
+        urls = {f"https://host{i}.com/page" for i in range(10)}
+
+        documents = _collect(urls, max_pages=4)
+
+        assert len(documents) == 4
+        assert len(FakeCrawler.instances[0].crawled) == 4
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])